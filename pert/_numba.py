@@ -0,0 +1,444 @@
+""" Optional Numba kernels for the PERT hot paths
+
+`numba` is not a hard dependency of `pertdist`. When it can be imported the
+kernels below are JIT-compiled and `PERT` dispatches large array inputs to
+them; otherwise `NUMBA_AVAILABLE` is False and the scipy-backed methods are
+used throughout.
+
+The `pdf`, `logpdf`, `cdf`, `ppf` and `rvs` functions take the PERT parameters
+directly, so they can be called from users' own jitted code. They are
+re-exported publicly by `pert.numba`.
+
+The incomplete beta function behind `cdf` and `ppf` is a continued
+fraction, accurate to about 1e-12 for lamb up to 1e3 and degrading beyond
+that, see `NUMBA_BETAINC_MAX_SHAPE`.
+"""
+
+import math
+import sys
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Continued fraction settings for `_betainc`
+_CF_MAX_ITER = 300
+_CF_EPS = 1e-15
+_CF_TINY = 1e-300
+
+# Newton iteration settings for `_betaincinv`
+_INV_MAX_ITER = 100
+_INV_EPS = 1e-14
+
+# Below this many elements scipy's dispatch overhead is small enough that
+# the JIT kernels are not worth the array coercion they need.
+NUMBA_MIN_SIZE = 1000
+
+# `_betainc` loses absolute accuracy roughly in proportion to alpha + beta
+# (lamb + 2 for a PERT): about 5e-13 at 1e3, but 7e-11 at 1e5. Above this
+# shape `PERT` keeps the CDF and inverse CDF on scipy.
+NUMBA_BETAINC_MAX_SHAPE = 1e3
+
+# fastmath without the `nnan`/`ninf` flags: log(0) must stay -inf so the
+# support edges come out exact, while `afn` still lets LLVM swap in
+# vectorised log/exp implementations.
+_SIMD_MATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+_TINY = sys.float_info.min
+_ONE_MINUS_EPS = 1.0 - sys.float_info.epsilon
+
+@njit(parallel=True, fastmath=_SIMD_MATH, cache=True)
+def _pert_pdf_kernel(val, a, inv_range, alpha_m1, beta_m1, logpdf_norm):
+    """ Evaluates the PERT PDF over a flat array for scalar parameters
+
+    The loop body is branch-free so it can be auto-vectorised. Where a shape
+    exponent is zero the clip bound on that side is nudged inside (0, 1),
+    which keeps `0 * log(0)` from producing NaN without a per-element test.
+
+    Parameters
+    ----------
+    val: 1-D float64 array
+        Values to return the PDF calculation on.
+    a: float
+        The PERT minimum value.
+    inv_range: float
+        Reciprocal of the PERT max - min range.
+    alpha_m1: float
+        The PERT alpha value, less 1.
+    beta_m1: float
+        The PERT beta value, less 1.
+    logpdf_norm: float
+        Negated log of the Beta function at (alpha, beta) plus the log of the
+        range, the constant term of the log-PDF.
+
+    Returns
+    -------
+    Array:
+        PDF values, with inputs outside of the PERT support clipped to it.
+    """
+
+    lo = 0.0 if alpha_m1 > 0.0 else _TINY
+    hi = 1.0 if beta_m1 > 0.0 else _ONE_MINUS_EPS
+
+    out = np.empty(val.size)
+    for i in prange(val.size):
+        x = min(max((val[i] - a) * inv_range, lo), hi)
+        out[i] = math.exp(alpha_m1 * math.log(x) + beta_m1 * math.log1p(-x) + logpdf_norm)
+    return out
+
+@njit(parallel=True, fastmath=_SIMD_MATH, cache=True)
+def _pert_logpdf_kernel(val, a, inv_range, alpha_m1, beta_m1, logpdf_norm):
+    """ Evaluates the PERT log-PDF over a flat array for scalar parameters
+
+    Same arguments and edge handling as `_pert_pdf_kernel`, without the final
+    `exp`.
+    """
+
+    lo = 0.0 if alpha_m1 > 0.0 else _TINY
+    hi = 1.0 if beta_m1 > 0.0 else _ONE_MINUS_EPS
+
+    out = np.empty(val.size)
+    for i in prange(val.size):
+        x = min(max((val[i] - a) * inv_range, lo), hi)
+        out[i] = alpha_m1 * math.log(x) + beta_m1 * math.log1p(-x) + logpdf_norm
+    return out
+
+@njit(cache=True)
+def _betacf(alpha, beta, x):
+    """ Continued fraction part of the regularized incomplete beta function
+
+    Evaluated with the modified Lentz method, converges quickly for
+    x < (alpha + 1) / (alpha + beta + 2).
+    """
+
+    qab = alpha + beta
+    qap = alpha + 1.0
+    qam = alpha - 1.0
+    c = 1.0
+    d = 1.0 - qab * x / qap
+    if abs(d) < _CF_TINY:
+        d = _CF_TINY
+    d = 1.0 / d
+    h = d
+    for m in range(1, _CF_MAX_ITER + 1):
+        m2 = 2 * m
+        aa = m * (beta - m) * x / ((qam + m2) * (alpha + m2))
+        d = 1.0 + aa * d
+        if abs(d) < _CF_TINY:
+            d = _CF_TINY
+        c = 1.0 + aa / c
+        if abs(c) < _CF_TINY:
+            c = _CF_TINY
+        d = 1.0 / d
+        h *= d * c
+        aa = -(alpha + m) * (qab + m) * x / ((alpha + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        if abs(d) < _CF_TINY:
+            d = _CF_TINY
+        c = 1.0 + aa / c
+        if abs(c) < _CF_TINY:
+            c = _CF_TINY
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < _CF_EPS:
+            break
+    return h
+
+@njit(cache=True)
+def _betainc(alpha, beta, x, log_beta):
+    """ Regularized incomplete beta function, a Numba-callable `betainc`
+
+    Parameters
+    ----------
+    alpha: float
+        First shape parameter.
+    beta: float
+        Second shape parameter.
+    x: float
+        Upper limit of integration, in [0, 1].
+    log_beta: float
+        Log of the Beta function at (alpha, beta).
+
+    Returns
+    -------
+    float:
+        The Beta(alpha, beta) CDF at x.
+    """
+
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = math.exp(alpha * math.log(x) + beta * math.log1p(-x) - log_beta)
+    if x < (alpha + 1.0) / (alpha + beta + 2.0):
+        return front * _betacf(alpha, beta, x) / alpha
+    return 1.0 - front * _betacf(beta, alpha, 1.0 - x) / beta
+
+@njit(cache=True)
+def _log_betainc(alpha, beta, x, log_beta):
+    """ Log of `_betainc`, without underflow deep in the lower tail
+
+    Same arguments as `_betainc`. The power-law front factor is kept as a log,
+    so tiny CDF values stay representable even where `_betainc` itself would
+    round them to 0.
+    """
+
+    if x <= 0.0:
+        return -math.inf
+    if x >= 1.0:
+        return 0.0
+    log_front = alpha * math.log(x) + beta * math.log1p(-x) - log_beta
+    if x < (alpha + 1.0) / (alpha + beta + 2.0):
+        return log_front + math.log(_betacf(alpha, beta, x) / alpha)
+    return math.log1p(-math.exp(log_front) * _betacf(beta, alpha, 1.0 - x) / beta)
+
+@njit(cache=True)
+def _betaincinv(alpha, beta, p, log_beta):
+    """ Inverse of the regularized incomplete beta function, a Numba-callable `betaincinv`
+
+    Upper-half probabilities are solved as the lower tail of the mirrored
+    Beta(beta, alpha), so `_betainc` is only ever inverted where it does not
+    suffer from cancellation.
+
+    Parameters
+    ----------
+    alpha: float
+        First shape parameter.
+    beta: float
+        Second shape parameter.
+    p: float
+        Probability, in [0, 1].
+    log_beta: float
+        Log of the Beta function at (alpha, beta).
+
+    Returns
+    -------
+    float:
+        The Beta(alpha, beta) quantile at p, NaN outside of [0, 1].
+    """
+
+    if not (0.0 <= p <= 1.0):
+        return math.nan
+    if p == 0.0:
+        return 0.0
+    if p == 1.0:
+        return 1.0
+    if p > 0.5:
+        return 1.0 - _betaincinv_lower(beta, alpha, 1.0 - p, log_beta)
+    return _betaincinv_lower(alpha, beta, p, log_beta)
+
+@njit(cache=True)
+def _betaincinv_lower(alpha, beta, p, log_beta):
+    """ Solves `_betainc(alpha, beta, x) == p` for p in (0, 0.5]
+
+    Newton's method is applied to `_log_betainc` against log(x). Near zero the CDF
+    behaves like x**alpha / (alpha * B), which is a straight line on that
+    scale, so the inverse of that power law is used as the starting guess and
+    convergence is fast even deep in the tail. Steps that would leave the
+    bracket found so far fall back to bisection.
+    """
+
+    log_p = math.log(p)
+    x = math.exp((log_p + math.log(alpha) + log_beta) / alpha)
+    if not (0.0 < x < 1.0):
+        x = 0.5
+
+    beta_m1 = beta - 1.0
+    lo = 0.0
+    hi = 1.0
+    for _ in range(_INV_MAX_ITER):
+        log_x = math.log(x)
+        log_cdf = _log_betainc(alpha, beta, x, log_beta)
+        if log_cdf == log_p:
+            return x
+        if log_cdf < log_p:
+            lo = x
+        else:
+            hi = x
+        # d log(CDF) / d log(x) is x * PDF / CDF
+        slope = math.exp(alpha * log_x + beta_m1 * math.log1p(-x) - log_beta - log_cdf)
+        x_new = -1.0
+        if slope > 0.0:
+            x_new = math.exp(log_x - (log_cdf - log_p) / slope)
+            if abs(x_new - x) <= _INV_EPS * x:
+                return x_new
+        if not (lo < x_new < hi):
+            x_new = 0.5 * (lo + hi)
+        x = x_new
+    return x
+
+@njit(parallel=True, cache=True)
+def _pert_cdf_kernel(val, a, inv_range, alpha, beta, log_beta):
+    """ Evaluates the PERT CDF over a flat array for scalar parameters
+
+    Parameters
+    ----------
+    val: 1-D float64 array
+        Values to return the CDF calculation on.
+    a: float
+        The PERT minimum value.
+    inv_range: float
+        Reciprocal of the PERT max - min range.
+    alpha: float
+        The PERT alpha value.
+    beta: float
+        The PERT beta value.
+    log_beta: float
+        Log of the Beta function at (alpha, beta).
+
+    Returns
+    -------
+    Array:
+        CDF values.
+    """
+
+    out = np.empty(val.size)
+    for i in prange(val.size):
+        out[i] = _betainc(alpha, beta, (val[i] - a) * inv_range, log_beta)
+    return out
+
+@njit(parallel=True, cache=True)
+def _pert_ppf_kernel(val, a, range_, alpha, beta, log_beta):
+    """ Evaluates the PERT inverse CDF over a flat array for scalar parameters
+
+    Parameters
+    ----------
+    val: 1-D float64 array
+        Probabilities to return the inverse CDF calculation on.
+    a: float
+        The PERT minimum value.
+    range_: float
+        The PERT max - min range.
+    alpha: float
+        The PERT alpha value.
+    beta: float
+        The PERT beta value.
+    log_beta: float
+        Log of the Beta function at (alpha, beta).
+
+    Returns
+    -------
+    Array:
+        Inverse CDF values.
+    """
+
+    out = np.empty(val.size)
+    for i in prange(val.size):
+        out[i] = _betaincinv(alpha, beta, val[i], log_beta) * range_ + a
+    return out
+
+@njit(cache=True)
+def _pert_shape(a, b, c, lamb):
+    """ Derives the Beta shape of a scalar PERT
+
+    Returns
+    -------
+    tuple:
+        The reciprocal of the range, alpha, beta and the log of the Beta
+        function at (alpha, beta).
+    """
+
+    inv_range = 1.0 / (c - a)
+    alpha = 1.0 + lamb * (b - a) * inv_range
+    beta = 1.0 + lamb * (c - b) * inv_range
+    log_beta = math.lgamma(alpha) + math.lgamma(beta) - math.lgamma(alpha + beta)
+    return inv_range, alpha, beta, log_beta
+
+@njit(cache=True)
+def pdf(x, a, b, c, lamb):
+    """ PERT PDF of a float64 array, for scalar PERT parameters
+
+    Inputs outside of [a, c] are clipped to the support, as in `PERT.pdf`.
+    """
+
+    inv_range, alpha, beta, log_beta = _pert_shape(a, b, c, lamb)
+    pdf_val = _pert_pdf_kernel(
+        x.ravel(), a, inv_range, alpha - 1.0, beta - 1.0, math.log(inv_range) - log_beta,
+    )
+    return pdf_val.reshape(x.shape)
+
+@njit(cache=True)
+def logpdf(x, a, b, c, lamb):
+    """ PERT log-PDF of a float64 array, for scalar PERT parameters
+
+    Inputs outside of [a, c] are clipped to the support, as in `PERT.logpdf`.
+    """
+
+    inv_range, alpha, beta, log_beta = _pert_shape(a, b, c, lamb)
+    logpdf_val = _pert_logpdf_kernel(
+        x.ravel(), a, inv_range, alpha - 1.0, beta - 1.0, math.log(inv_range) - log_beta,
+    )
+    return logpdf_val.reshape(x.shape)
+
+@njit(cache=True)
+def cdf(x, a, b, c, lamb):
+    """ PERT CDF of a float64 array, for scalar PERT parameters """
+
+    inv_range, alpha, beta, log_beta = _pert_shape(a, b, c, lamb)
+    cdf_val = _pert_cdf_kernel(x.ravel(), a, inv_range, alpha, beta, log_beta)
+    return cdf_val.reshape(x.shape)
+
+@njit(cache=True)
+def ppf(q, a, b, c, lamb):
+    """ PERT inverse CDF of a float64 array, for scalar PERT parameters """
+
+    _, alpha, beta, log_beta = _pert_shape(a, b, c, lamb)
+    ppf_val = _pert_ppf_kernel(q.ravel(), a, c - a, alpha, beta, log_beta)
+    return ppf_val.reshape(q.shape)
+
+@njit(cache=True)
+def rvs(a, b, c, lamb, size):
+    """ Samples `size` values from a scalar PERT
+
+    Draws from Numba's own random state, seed it with `np.random.seed` from
+    inside jitted code for reproducible samples.
+    """
+
+    _, alpha, beta, _ = _pert_shape(a, b, c, lamb)
+    return a + (c - a) * np.random.beta(alpha, beta, size)
+
+@njit(cache=True)
+def _validate_kernel(a, b, c):
+    """ Checks PERT parameters are finite and ordered in a single pass over flat arrays
+
+    Parameters
+    ----------
+    a: 1-D float64 array
+        The PERT minimum values.
+    b: 1-D float64 array
+        The PERT most likely values.
+    c: 1-D float64 array
+        The PERT maximum values.
+
+    Returns
+    -------
+    int:
+        Bit flags of the violations found: 1 if any b < a, 2 if any c < b,
+        4 if any a, b and c are all (numpy `isclose`) equal and 8 if any value
+        is not finite.
+    """
+
+    flags = 0
+    for i in range(a.size):
+        if not (math.isfinite(a[i]) and math.isfinite(b[i]) and math.isfinite(c[i])):
+            flags |= 8
+        if b[i] < a[i]:
+            flags |= 1
+        if c[i] < b[i]:
+            flags |= 2
+        if (abs(a[i] - b[i]) <= 1e-8 + 1e-5 * abs(b[i])
+                and abs(b[i] - c[i]) <= 1e-8 + 1e-5 * abs(c[i])):
+            flags |= 4
+        if flags == 15:
+            break
+    return flags
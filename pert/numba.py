@@ -0,0 +1,16 @@
+""" Numba-compiled PERT functions for use inside jitted code
+
+Requires `numba` (`pip install pertdist[numba]`). Parameters are scalars and
+`x` is a float64 array, following the `numba_stats` conventions.
+
+`cdf` and `ppf` use a continued fraction for the incomplete beta function.
+They agree with scipy to about 1e-12 for lamb up to 1e3, with the error
+growing in proportion to lamb beyond that.
+"""
+
+from ._numba import NUMBA_AVAILABLE
+
+if not NUMBA_AVAILABLE:
+    raise ImportError('pert.numba requires numba to be installed.')
+
+from ._numba import cdf, logpdf, pdf, ppf, rvs
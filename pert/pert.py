@@ -1,10 +1,61 @@
+import math
+from collections import namedtuple
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+
 import numpy as np
-from scipy.special import beta, betainc
-from scipy.stats import beta as beta_dist
-from scipy.stats import norm as norm_dist
+from scipy.special import (
+    betainc, betaincc, betainccinv, betaincinv, betaln, erf, xlog1py, xlogy,
+)
+from scipy.stats import qmc
+
+from ._numba import (
+    NUMBA_AVAILABLE, NUMBA_BETAINC_MAX_SHAPE, NUMBA_MIN_SIZE, _pert_cdf_kernel, _pert_logpdf_kernel, _pert_pdf_kernel,
+    _pert_ppf_kernel, _validate_kernel,
+)
 
 Array = np.array
 
+# Bit flags returned by `PERT._validate`, in the order they are reported.
+_VALIDATION_ERRORS = (
+    (8, 'Non-finite values present in inputs.'),
+    (1, 'min_val parameter should be lower than ml_val.'),
+    (2, 'ml_val parameter should be lower than max_val.'),
+    (4, 'min_val, ml_val and max_val parameter should be different.'),
+)
+
+# Floating point types with scipy.special loops, the only ones `PERT` can store.
+_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+# Integer-seeded `rvs` draws of at most this many values are memoised per
+# instance, keeping at most `_RVS_CACHE_ENTRIES` of them.
+_RVS_CACHE_MAX_SIZE = 1024
+_RVS_CACHE_ENTRIES = 32
+
+# Plain-float copies of a scalar PERT, used by the scalar-input fast paths and
+# the Numba kernels.
+_ScalarParams = namedtuple(
+    '_ScalarParams', ['a', 'range', 'inv_range', 'alpha', 'beta', 'logpdf_norm', 'log_beta'],
+)
+
+# Quantile grids of at most this many float64 values are memoised by `ppf`
+# for scalar PERTs, large arrays go straight to `betaincinv`.
+_PPF_CACHE_MAX_SIZE = 64
+
+@lru_cache(maxsize=128)
+def _ppf_unit_cached(alpha:float, beta:float, q_bytes:bytes, shape:tuple) -> Array:
+    """ Memoised `betaincinv` over a small float64 quantile grid
+    
+    The grid is passed as raw bytes so it can be hashed. The returned array is
+    shared between calls, so it is made read-only and callers must not write
+    to it.
+    """
+    
+    q = np.frombuffer(q_bytes, dtype=np.float64).reshape(shape)
+    ppf_unit = betaincinv(alpha, beta, q)
+    ppf_unit.flags.writeable = False
+    return ppf_unit
+
 class PERT:
     """ Implementation of the Beta-PERT distribution
     
@@ -22,6 +73,9 @@ class PERT:
         The maximum value(s) of the PERT.
     lamb: float (default 4.0)
         The PERT's lambda parameter, smaller values give a wider probability spread.
+    dtype: numpy dtype (default np.float64)
+        Floating point type the parameters and derived values are stored in,
+        np.float32 or np.float64. np.float32 halves the memory traffic of large parameter arrays.
         
     Attributes
     ----------
@@ -35,6 +89,8 @@ class PERT:
         Contains the PERT max - min range.
     lamb: float
         The PERT lambda parameter. Should be greater than 0.
+    dtype: numpy dtype
+        Floating point type of the PERT parameter and statistic arrays.
     alpha: Array
         Contains the PERT alpha values, as a part of the Beta distribution calculation.
     beta: Array
@@ -49,26 +105,87 @@ class PERT:
         Contains the PERT kurtosis values.
     """
     
-    def __init__(self, min_val:Array, ml_val:Array, max_val:Array, lamb=4.0):
-        
-        self.a = np.asarray(min_val)
-        self.b = np.asarray(ml_val)
-        self.c = np.asarray(max_val)
+    def __init__(self, min_val:Array, ml_val:Array, max_val:Array, lamb=4.0, dtype=np.float64):
+        
+        # One contiguous (3, ...) block, one row per parameter, so each of
+        # a, b and c is a contiguous stream of the broadcast shape.
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in _DTYPES:
+            raise ValueError('dtype parameter should be np.float32 or np.float64.')
+        shape = np.broadcast(min_val, ml_val, max_val).shape
+        self._params = np.empty((3,) + shape, dtype=self.dtype)
+        self._params[0, ...] = min_val
+        self._params[1, ...] = ml_val
+        self._params[2, ...] = max_val
+        self.a = self._params[0, ...]
+        self.b = self._params[1, ...]
+        self.c = self._params[2, ...]
         self.lamb = lamb
         
+        if not np.all(np.isfinite(lamb)):
+            raise ValueError('Non-finite values present in inputs.')
         if np.any(lamb <= 0):
             raise ValueError('lamb parameter should be greater than 0.')
-        if np.any(self.b < self.a):
-            raise ValueError('min_val parameter should be lower than ml_val.')
-        if np.any(self.c < self.b):
-            raise ValueError('ml_val parameter should be lower than max_val.')
-        # in case any a == b == c. Deals with arrays and floating error
-        if np.any(np.multiply(np.isclose(self.a, self.b), 
-                              np.isclose(self.b, self.c))):
-            raise ValueError('min_val, ml_val and max_val parameter should be different.')
+        flags = self._validate(self.a, self.b, self.c)
+        for flag, msg in _VALIDATION_ERRORS:
+            if flags & flag:
+                raise ValueError(msg)
 
         self.build()
         
+    def __repr__(self) -> str:
+        """ Summarises the PERT parameters and statistics
+        
+        The string is formatted on the first call and reused afterwards.
+        """
+        
+        if self._repr_str is None:
+            self._repr_str = (
+                f'PERT(a={self.a}, b={self.b}, c={self.c}, lamb={self.lamb}, '
+                f'alpha={self.alpha}, beta={self.beta}, mean={self.mean}, '
+                f'var={self.var}, skew={self.skew}, kurt={self.kurt})'
+            )
+        return self._repr_str
+    
+    @staticmethod
+    def _validate(a:Array, b:Array, c:Array) -> int:
+        """ Checks the PERT parameters are finite and correctly ordered
+        
+        Large parameter arrays are checked in a single pass by a Numba kernel
+        when available, rather than one NumPy reduction per rule.
+        
+        Parameters
+        ----------
+        a: Array
+            The PERT minimum values.
+        b: Array
+            The PERT most likely values.
+        c: Array
+            The PERT maximum values.
+            
+        Returns
+        -------
+        int:
+            Bit flags of the violated rules, see `_VALIDATION_ERRORS`.
+        """
+        
+        a, b, c = np.broadcast_arrays(a, b, c)
+        if NUMBA_AVAILABLE and a.size >= NUMBA_MIN_SIZE:
+            a, b, c = (np.ascontiguousarray(arr, dtype=np.float64).ravel() for arr in (a, b, c))
+            return _validate_kernel(a, b, c)
+        
+        flags = 0
+        if not (np.isfinite(a).all() and np.isfinite(b).all() and np.isfinite(c).all()):
+            flags |= 8
+        if np.any(b < a):
+            flags |= 1
+        if np.any(c < b):
+            flags |= 2
+        # in case any a == b == c. Deals with arrays and floating error
+        if np.any(np.multiply(np.isclose(a, b), np.isclose(b, c))):
+            flags |= 4
+        return flags
+    
     def build(self):
         """ Calculates core PERT statistics
         
@@ -77,36 +194,273 @@ class PERT:
         modified-PERT on Wikipedia).
         """
         
-        self.alpha = np.asarray(1 + (self.lamb * ((self.b-self.a) / (self.c-self.a))))
-        self.beta = np.asarray(1 + (self.lamb * ((self.c-self.b) / (self.c-self.a))))
-        
-        self.mean = np.asarray((self.a + (self.lamb*self.b) + self.c) / (2+self.lamb))
-        self.var = np.asarray(((self.mean-self.a) * (self.c-self.mean)) / (self.lamb+3))
-        self.skew = np.asarray((
-            2 * (self.beta - self.alpha) * np.sqrt(self.alpha + self.beta + 1)
-        ) / (
-            (self.alpha + self.beta + 2) * np.sqrt(self.alpha * self.beta)
-        ))
-        self.kurt = np.asarray((
-            (self.lamb+2) * ((
-                ((self.alpha - self.beta)**2) * (self.alpha + self.beta + 1)
-            ) + (
-                self.alpha * self.beta * (self.alpha + self.beta + 2)
-            ))
-        ) / (
-            self.alpha * self.beta * (self.alpha + self.beta + 2) * (self.alpha + self.beta + 3)
-        ))
-        
-    @property
-    def range(self):
-        """ Calculates the min-max range
+        shape = np.broadcast(self.a, self.b, self.c, self.lamb).shape
+        
+        # alpha + beta collapses to lamb + 2, so the shared shape terms are
+        # scalars (or lamb-shaped) and never need a pass over the parameters.
+        ab = self.lamb + 2
+        ab1 = ab + 1
+        
+        rng = np.subtract(self.c, self.a, out=np.empty(shape, dtype=self.dtype))
+        inv_rng = np.divide(1.0, rng, out=np.empty(shape, dtype=self.dtype))
+        
+        alpha = np.subtract(self.b, self.a, out=np.empty(shape, dtype=self.dtype))
+        np.multiply(alpha, inv_rng, out=alpha)
+        np.multiply(alpha, self.lamb, out=alpha)
+        np.add(alpha, 1, out=alpha)
+        beta = np.subtract(self.c, self.b, out=np.empty(shape, dtype=self.dtype))
+        np.multiply(beta, inv_rng, out=beta)
+        np.multiply(beta, self.lamb, out=beta)
+        np.add(beta, 1, out=beta)
+        
+        mean = np.multiply(self.b, self.lamb, out=np.empty(shape, dtype=self.dtype))
+        np.add(mean, self.a, out=mean)
+        np.add(mean, self.c, out=mean)
+        np.divide(mean, ab, out=mean)
+        var = np.subtract(mean, self.a, out=np.empty(shape, dtype=self.dtype))
+        np.multiply(var, np.subtract(self.c, mean), out=var)
+        np.divide(var, ab1, out=var)
+        
+        self.range = rng
+        self._inv_range = inv_rng
+        self._log_range = np.log(rng)
+        
+        self.alpha = alpha
+        self.beta = beta
+        self._log_beta = betaln(alpha, beta)
+        self._logpdf_norm = -(self._log_beta + self._log_range)
+        self._alpha_m1 = alpha - 1
+        self._beta_m1 = beta - 1
+        self._gpu_params = None
+        
+        self._scalar_params = alpha.ndim == 0
+        self._scalars = _ScalarParams(
+            float(self.a), float(rng), float(inv_rng), float(alpha), float(beta),
+            float(self._logpdf_norm), float(self._log_beta),
+        ) if self._scalar_params else None
+        self.mean = mean
+        self.var = var
+        # skew and kurt are evaluated lazily, drop any values from a prior build
+        self.__dict__.pop('skew', None)
+        self.__dict__.pop('kurt', None)
+        self._stats = None
+        self._repr_str = None
+        self._rvs_cache = {}
+        
+    @cached_property
+    def skew(self):
+        """ Calculates the skewness, on first access only
+        
+        Returns
+        -------
+        Array:
+            Array of skewness values.
+        """
+        
+        ab = self.lamb + 2
+        skew = np.asarray(
+            (2 * (self.beta - self.alpha) * np.sqrt(ab + 1))
+            / ((ab + 2) * np.sqrt(self.alpha * self.beta)),
+            dtype=self.dtype,
+        )
+        return skew
+    
+    @cached_property
+    def kurt(self):
+        """ Calculates the kurtosis, on first access only
+        
+        Returns
+        -------
+        Array:
+            Array of kurtosis values.
+        """
+        
+        ab = self.lamb + 2
+        ab_prod = self.alpha * self.beta
+        kurt = np.asarray(
+            (ab * (((self.alpha - self.beta)**2) * (ab + 1) + ab_prod * (ab + 2)))
+            / (ab_prod * (ab + 2) * (ab + 3)),
+            dtype=self.dtype,
+        )
+        return kurt
+    
+    @staticmethod
+    def _to_arr(val:Array) -> Array:
+        """ Coerces a method input to an ndarray, once at the top of the method
+        
+        Arrays are passed through untouched, anything else (lists, NumPy
+        scalars) is converted to float64 so the helpers and ufuncs further down
+        do not each repeat the conversion.
+        """
+        
+        return val if isinstance(val, np.ndarray) else np.asarray(val, dtype=np.float64)
+    
+    def _to_unit_interval(self, val:Array, out:Array=None) -> Array:
+        """ Maps values onto the underlying Beta distribution's [0, 1] support
+        
+        Parameters
+        ----------
+        val: numeric or numeric-array
+            Values on the PERT scale. Values outside [min_val, max_val] are clipped.
+        out: Array (default None)
+            Array to write the results to. Allocated if not provided.
+        
+        Returns
+        -------
+        Array:
+            Values rescaled to [0, 1].
+        """
+        
+        x = np.empty(np.broadcast(val, self._inv_range).shape, dtype=self.dtype) if out is None else out
+        np.subtract(val, self.a, out=x)
+        np.multiply(x, self._inv_range, out=x)
+        np.maximum(x, 0.0, out=x)
+        np.minimum(x, 1.0, out=x)
+        return x
+    
+    def _scalar_unit(self, val:float) -> float:
+        """ Scalar version of `_to_unit_interval`, using plain float math
+        
+        Only valid when the PERT parameters are scalars, `PERT` methods use it
+        to skip the NumPy machinery for Python float inputs.
+        
+        Parameters
+        ----------
+        val: float
+            Value on the PERT scale.
+        
+        Returns
+        -------
+        float:
+            Value rescaled to [0, 1].
+        """
+        
+        x = min(max((val - self._scalars.a) * self._scalars.inv_range, 0.0), 1.0)
+        return x
+    
+    def _scalar_logpdf(self, val:float) -> float:
+        """ Scalar version of `logpdf`, using plain float math
+        
+        Parameters
+        ----------
+        val: float
+            Value to return the log-PDF calculation on
+        
+        Returns
+        -------
+        float:
+            Log-PDF value based on the val parameter
+        """
+        
+        x = self._scalar_unit(val)
+        if x != x:
+            return math.nan
+        alpha, beta = self._scalars.alpha, self._scalars.beta
+        # mirrors xlogy/xlog1py: a zero exponent contributes nothing, even at the edges
+        logpdf_val = self._scalars.logpdf_norm
+        if alpha != 1:
+            logpdf_val += (alpha - 1) * math.log(x) if x > 0 else -math.inf
+        if beta != 1:
+            logpdf_val += (beta - 1) * math.log1p(-x) if x < 1 else -math.inf
+        return logpdf_val
+    
+    def _logpdf_core(self, x:Array) -> Array:
+        """ Evaluates the log-PDF in place on unit-interval values
+        
+        Shared by `pdf`, `pdf_batch` and `logpdf`, which only differ in whether
+        the result is exponentiated.
+        
+        Parameters
+        ----------
+        x: Array
+            Values already mapped to [0, 1] by `_to_unit_interval`, overwritten
+            with the results.
+        
+        Returns
+        -------
+        Array:
+            Log-PDF values, stored in `x`
+        """
+        
+        tmp = np.negative(x, out=np.empty_like(x))
+        xlog1py(self._beta_m1, tmp, out=tmp)
+        xlogy(self._alpha_m1, x, out=x)
+        np.add(x, tmp, out=x)
+        np.add(x, self._logpdf_norm, out=x)
+        return x
+    
+    @staticmethod
+    def _betainc_inplace(alpha:Array, beta:Array, x:Array) -> Array:
+        """ Evaluates the regularized incomplete beta function in place
+        
+        Values clipped to 0 or 1 by `_to_unit_interval` already equal their
+        CDF, so `betainc` is only evaluated strictly inside the support and
+        out-of-support inputs skip it entirely.
+        
+        Parameters
+        ----------
+        alpha: Array
+            First Beta shape parameter.
+        beta: Array
+            Second Beta shape parameter.
+        x: Array
+            Values in [0, 1], overwritten with the results.
         
         Returns
         -------
         Array:
-            Array of range values of max-min.
+            Beta(alpha, beta) CDF values, stored in `x`
         """
-        return np.asarray(self.c - self.a)
+        
+        return betainc(alpha, beta, x, out=x, where=(x > 0) & (x < 1))
+    
+    @staticmethod
+    def _betaincc_unit(alpha:Array, beta:Array, x:Array) -> Array:
+        """ Evaluates the complemented regularized incomplete beta function
+        
+        Counterpart of `_betainc_inplace` for the survival function. `betaincc`
+        keeps full relative precision in the upper tail, where `1 - betainc`
+        would cancel. Clipped values of 0 and 1 map to 1 and 0 without it.
+        
+        Parameters
+        ----------
+        alpha: Array
+            First Beta shape parameter.
+        beta: Array
+            Second Beta shape parameter.
+        x: Array
+            Values in [0, 1].
+        
+        Returns
+        -------
+        Array:
+            Beta(alpha, beta) survival function values.
+        """
+        
+        sf_val = np.subtract(1, x, out=np.empty_like(x))
+        betaincc(alpha, beta, x, out=sf_val, where=(x > 0) & (x < 1))
+        return sf_val
+    
+    def _use_jit(self, val:Array, uses_betainc:bool=False) -> bool:
+        """ Checks whether `val` should be handed to the Numba kernels
+        
+        The kernels are only used for scalar PERT parameters and inputs large
+        enough to amortise the conversion to a flat float64 array. `val` must
+        already have been through `_to_arr`. Kernels built on the Numba
+        incomplete beta function (`uses_betainc`) are also skipped for shapes
+        past `NUMBA_BETAINC_MAX_SHAPE`, where scipy is more accurate.
+        """
+        
+        if not (NUMBA_AVAILABLE and self._scalar_params and val.size >= NUMBA_MIN_SIZE):
+            return False
+        shape = self._scalars.alpha + self._scalars.beta
+        return not uses_betainc or shape <= NUMBA_BETAINC_MAX_SHAPE
+    
+    def _jit_apply(self, kernel, val:Array, *args) -> Array:
+        """ Runs a flat-array Numba kernel over `val`, keeping its shape and the PERT dtype """
+        
+        out = kernel(np.ascontiguousarray(val, dtype=np.float64).ravel(), *args)
+        return out.reshape(val.shape).astype(self.dtype, copy=False)
     
     def median(self):
         """ Calculates the median
@@ -116,27 +470,139 @@ class PERT:
         Array:
             Array of median values.
         """
-        median = (beta_dist(self.alpha, self.beta).median() * self.range) + self.a
+        
+        median = (betaincinv(self.alpha, self.beta, 0.5) * self.range) + self.a
         return median
 
     
-    def rvs(self, size=1, random_state=None):
+    def rvs(self, size=1, random_state=None, backend='numpy'):
         """ Returns a randompy-sampled value from the PERT
         
         Parameters
         ----------
-        size: int (default 1)
-            Indicates how many random values should be returned
-        random_state: int (default none)
-            Seed value for random sample RNG.
+        size: int or tuple of ints (default 1)
+            Indicates how many random values should be returned for each set
+            of PERT parameters. A vectorized PERT returns samples with shape
+            (*size, *parameter shape).
+        random_state: int or np.random.Generator (default none)
+            Seed value for random sample RNG, or a NumPy Generator to draw from.
+        backend: str (default 'numpy')
+            Either 'numpy', or 'cupy' to sample on the GPU by inverse-CDF
+            transform. The 'cupy' backend requires `cupy` and returns a
+            `cupy.ndarray`.
+            
+        Returns
+        -------
+        Array:
+            Randomly sampled values from the PERT dristribution.
+        """
+        
+        if backend not in ('numpy', 'cupy'):
+            raise ValueError("backend parameter should be 'numpy' or 'cupy'.")
+        if size is not None:
+            size = tuple(np.atleast_1d(size)) + self.alpha.shape
+        if backend == 'cupy':
+            return self._rvs_cupy(size, random_state)
+        
+        # A fixed integer seed always yields the same draw, so small draws are
+        # memoised rather than re-seeding a Generator on every call.
+        cache_key = None
+        if (isinstance(random_state, (int, np.integer)) and not isinstance(random_state, bool)
+                and size is not None and math.prod(size) <= _RVS_CACHE_MAX_SIZE):
+            cache_key = (int(random_state), size)
+            if cache_key in self._rvs_cache:
+                return self._rvs_cache[cache_key].copy()
+        
+        if isinstance(random_state, (np.random.Generator, np.random.RandomState)):
+            rng = random_state
+        else:
+            rng = np.random.default_rng(random_state)
+        
+        if self._scalar_params:
+            sc = self._scalars
+            rvs_vals = rng.beta(sc.alpha, sc.beta, size=size)
+            scale, loc = sc.range, sc.a
+        else:
+            rvs_vals = rng.beta(self.alpha, self.beta, size=size)
+            scale, loc = self.range, self.a
+        
+        # rescale the Beta draws in place in the PERT dtype, `size=None` on a
+        # scalar PERT gives a float
+        if isinstance(rvs_vals, np.ndarray):
+            # Generator.beta always draws float64
+            rvs_vals = rvs_vals.astype(self.dtype, copy=False)
+            np.multiply(rvs_vals, scale, out=rvs_vals)
+            np.add(rvs_vals, loc, out=rvs_vals)
+        else:
+            rvs_vals = rvs_vals * scale + loc
+        
+        if cache_key is not None:
+            if len(self._rvs_cache) >= _RVS_CACHE_ENTRIES:
+                self._rvs_cache.pop(next(iter(self._rvs_cache)))
+            self._rvs_cache[cache_key] = rvs_vals.copy()
+        return rvs_vals
+    
+    def qmc_rvs(self, n:int, scramble:bool=True, seed=None) -> Array:
+        """ Returns quasi-random samples from the PERT using a Sobol sequence
+        
+        Low-discrepancy points are mapped through the inverse Beta CDF, which
+        gives Monte Carlo estimates that converge faster than `rvs` for the
+        same number of samples. Each parameter set of a vectorized PERT is
+        given its own Sobol dimension.
+        
+        Parameters
+        ----------
+        n: int
+            Number of samples to return. Sobol sequences are balanced when this
+            is a power of 2.
+        scramble: bool (default True)
+            Whether to scramble the Sobol sequence.
+        seed: int (default None)
+            Seed value for the scrambling RNG.
             
         Returns
         -------
         Array:
+            Quasi-random values from the PERT distribution, with shape
+            (n, *parameter shape).
+        """
+        
+        sampler = qmc.Sobol(d=max(self.alpha.size, 1), scramble=scramble, seed=seed)
+        u = sampler.random(n).astype(self.dtype, copy=False).reshape((n,) + self.alpha.shape)
+        qmc_vals = betaincinv(self.alpha, self.beta, u) * self.range + self.a
+        return qmc_vals
+    
+    def _rvs_cupy(self, size, random_state):
+        """ Samples from the PERT on the GPU with CuPy
+        
+        Draws uniforms on the device and maps them through the inverse Beta
+        CDF. Device copies of the PERT parameters are made on first use and
+        kept for later calls.
+        
+        Parameters
+        ----------
+        size: tuple of ints
+            Full output shape, already extended by the parameter shape.
+        random_state: int
+            Seed value for random sample RNG.
+            
+        Returns
+        -------
+        cupy.ndarray:
             Randomly sampled values from the PERT dristribution.
         """
         
-        rvs_vals = (beta_dist(self.alpha, self.beta).rvs(size=size, random_state=random_state) * self.range) + self.a
+        import cupy
+        from cupyx.scipy.special import betaincinv as betaincinv_gpu
+        
+        if self._gpu_params is None:
+            self._gpu_params = tuple(
+                cupy.asarray(arr) for arr in (self.alpha, self.beta, self.range, self.a)
+            )
+        alpha, beta, rng, a = self._gpu_params
+        
+        u = cupy.random.default_rng(random_state).random(size=size, dtype=self.dtype)
+        rvs_vals = betaincinv_gpu(alpha, beta, u) * rng + a
         return rvs_vals
     
     def pdf(self, val:Array) -> Array:
@@ -153,10 +619,45 @@ class PERT:
             PDF values based on the val parameter
         """
         
-        x = ((val - self.a) / self.range).clip(0,1)
-        pdf_val = beta_dist.pdf(x, self.alpha, self.beta) / self.range
+        if isinstance(val, (int, float)) and self._scalar_params:
+            return math.exp(self._scalar_logpdf(val))
+        
+        val = self._to_arr(val)
+        if self._use_jit(val):
+            sc = self._scalars
+            return self._jit_apply(
+                _pert_pdf_kernel, val, sc.a, sc.inv_range, sc.alpha - 1, sc.beta - 1,
+                sc.logpdf_norm,
+            )
+        
+        pdf_val = self.pdf_batch(val)
         return pdf_val
     
+    def pdf_batch(self, val:Array, out:Array=None) -> Array:
+        """ Calculates the PDF value for a set of inputs into a reusable buffer
+        
+        Equivalent to `pdf`, but the whole calculation is carried out in `out`
+        with a single scratch array, which suits repeated PDF lookups over
+        many probe points.
+        
+        Parameters
+        ----------
+        val: numeric or numeric-array
+            Values to return the PDF calculation on
+        out: Array (default None)
+            Array of the PERT's dtype to write the results to, with the broadcast
+            shape of `val` and the PERT parameters. Allocated if not provided.
+        
+        Returns
+        -------
+        Array:
+            PDF values based on the val parameter, stored in `out`
+        """
+        
+        out = self._logpdf_core(self._to_unit_interval(self._to_arr(val), out=out))
+        np.exp(out, out=out)
+        return out
+    
     def logpdf(self, val) -> Array:
         """ Calculates the log-PDF value for a set of inputs
         
@@ -171,7 +672,18 @@ class PERT:
             Log-PDF values based on the val parameter
         """
         
-        logpdf_val = np.log(self.pdf(val))
+        if isinstance(val, (int, float)) and self._scalar_params:
+            return self._scalar_logpdf(val)
+        
+        val = self._to_arr(val)
+        if self._use_jit(val):
+            sc = self._scalars
+            return self._jit_apply(
+                _pert_logpdf_kernel, val, sc.a, sc.inv_range, sc.alpha - 1, sc.beta - 1,
+                sc.logpdf_norm,
+            )
+        
+        logpdf_val = self._logpdf_core(self._to_unit_interval(val))
         return logpdf_val
     
     def cdf(self, val) -> Array:
@@ -188,8 +700,19 @@ class PERT:
             CDF values based on the val parameter
         """
         
-        x = ((val - self.a) / self.range).clip(0,1)
-        cdf_val = beta_dist.cdf(x, self.alpha, self.beta)
+        if isinstance(val, (int, float)) and self._scalar_params:
+            sc = self._scalars
+            return float(betainc(sc.alpha, sc.beta, self._scalar_unit(val)))
+        
+        val = self._to_arr(val)
+        if self._use_jit(val, uses_betainc=True):
+            sc = self._scalars
+            return self._jit_apply(
+                _pert_cdf_kernel, val, sc.a, sc.inv_range, sc.alpha, sc.beta, sc.log_beta,
+            )
+        
+        x = self._to_unit_interval(val)
+        cdf_val = self._betainc_inplace(self.alpha, self.beta, x)
         return cdf_val
     
     def sf(self, val) -> Array:
@@ -206,8 +729,13 @@ class PERT:
             survival function based on the val parameter
         """
         
-        x = ((val - self.a) / self.range).clip(0,1)
-        sf_val = beta_dist.sf(x, self.alpha, self.beta)
+        if isinstance(val, (int, float)) and self._scalar_params:
+            sc = self._scalars
+            return float(betaincc(sc.alpha, sc.beta, self._scalar_unit(val)))
+        
+        val = self._to_arr(val)
+        x = self._to_unit_interval(val)
+        sf_val = self._betaincc_unit(self.alpha, self.beta, x)
         return sf_val
 
     def logsf(self, val) -> Array:
@@ -224,8 +752,15 @@ class PERT:
             log of the survival function based on the val parameter
         """
         
-        x = ((val - self.a) / self.range).clip(0,1)
-        logsf_val = beta_dist.logsf(x, self.alpha, self.beta)
+        if isinstance(val, (int, float)) and self._scalar_params:
+            sf_val = self.sf(val)
+            return math.log(sf_val) if sf_val != 0 else -math.inf
+        
+        val = self._to_arr(val)
+        x = self._to_unit_interval(val)
+        sf_val = self._betaincc_unit(self.alpha, self.beta, x)
+        logsf_val = np.full_like(sf_val, -np.inf)
+        np.log(sf_val, out=logsf_val, where=~(sf_val <= 0))
         return logsf_val
 
     def ppf(self, val) -> Array:
@@ -239,11 +774,29 @@ class PERT:
         Returns
         -------
         Array:
-            CDF values based on the val parameter
+            Inverse CDF values based on the val parameter, in the PERT's dtype
+            for array inputs
         """
         
-        ppf_val = beta_dist.ppf(val, self.alpha, self.beta) * self.range + self.a
-        return ppf_val
+        if isinstance(val, (int, float)) and self._scalar_params:
+            sc = self._scalars
+            return float(betaincinv(sc.alpha, sc.beta, val)) * sc.range + sc.a
+        
+        val = self._to_arr(val)
+        if (self._scalar_params and val.dtype == np.float64
+                and 0 < val.ndim and val.size <= _PPF_CACHE_MAX_SIZE):
+            # fixed grids of probabilities are commonly re-queried, e.g. in fitting loops
+            sc = self._scalars
+            ppf_unit = _ppf_unit_cached(sc.alpha, sc.beta, val.tobytes(), val.shape)
+            return (ppf_unit * sc.range + sc.a).astype(self.dtype, copy=False)
+        if self._use_jit(val, uses_betainc=True):
+            sc = self._scalars
+            return self._jit_apply(
+                _pert_ppf_kernel, val, sc.a, sc.range, sc.alpha, sc.beta, sc.log_beta,
+            )
+        
+        ppf_val = betaincinv(self.alpha, self.beta, val) * self.range + self.a
+        return ppf_val.astype(self.dtype, copy=False)
         
     def isf(self, val) -> Array:
         """ Calculates the inverse survival function for a set of inputs
@@ -256,10 +809,17 @@ class PERT:
         Returns
         -------
         Array:
-            inverse of the survival function values based on the val parameter
+            inverse of the survival function values based on the val parameter,
+            in the PERT's dtype for array inputs
         """
-        isf_val = beta_dist.isf(val, self.alpha, self.beta) * self.range + self.a
-        return isf_val
+        
+        if isinstance(val, (int, float)) and self._scalar_params:
+            sc = self._scalars
+            return float(betainccinv(sc.alpha, sc.beta, val)) * sc.range + sc.a
+        
+        val = self._to_arr(val)
+        isf_val = betainccinv(self.alpha, self.beta, val) * self.range + self.a
+        return isf_val.astype(self.dtype, copy=False)
 
     def logcdf(self, val) -> Array:
         """ Calculates the log-CDF value for a set of inputs
@@ -275,25 +835,37 @@ class PERT:
             Log-CDF values based on the val parameter
         """
         
-        logcdf_val = np.log(self.cdf(val))
+        if isinstance(val, (int, float)) and self._scalar_params:
+            cdf_val = self.cdf(val)
+            return math.log(cdf_val) if cdf_val != 0 else -math.inf
+        
+        val = self._to_arr(val)
+        x = self._to_unit_interval(val)
+        cdf_val = self._betainc_inplace(self.alpha, self.beta, x)
+        logcdf_val = np.full_like(cdf_val, -np.inf)
+        np.log(cdf_val, out=logcdf_val, where=~(cdf_val <= 0))
         return logcdf_val
     
-    def stats(self) -> dict:
+    def stats(self) -> MappingProxyType:
         """ Returns basic statistics on the PERT
         
+        The mapping is built on the first call and the same read-only view is
+        returned afterwards.
+        
         Returns
         -------
-        dict:
+        MappingProxyType:
             Contains the PERT mean, variance, skewness and kurtosis
         """
         
-        stats = {
-            'mean': self.mean,
-            'var': self.var,
-            'skewness': self.skew,
-            'kurtosis': self.kurt,
-        }
-        return stats
+        if self._stats is None:
+            self._stats = MappingProxyType({
+                'mean': self.mean,
+                'var': self.var,
+                'skewness': self.skew,
+                'kurtosis': self.kurt,
+            })
+        return self._stats
     
     def interval(self, alpha:float) -> Array:
         """ Calculates the endpoints of a confidence interval range using alpha
@@ -311,8 +883,12 @@ class PERT:
             the range, second element is the high end of the range.
         """
         
-        interval = beta_dist.interval(alpha, self.alpha, self.beta)
-        interval = np.array([(val * self.range) + self.a for val in interval])
+        # both endpoints go through a single betaincinv call, stacked on a new
+        # leading axis after broadcasting against the parameter shape
+        alpha = np.asarray(alpha)
+        q_lo, q_hi, _ = np.broadcast_arrays((1 - alpha) / 2, (1 + alpha) / 2, self.alpha)
+        q = np.stack((q_lo, q_hi)).astype(self.dtype, copy=False)
+        interval = betaincinv(self.alpha, self.beta, q) * self.range + self.a
         return interval
     
     def ci(self, z:float) -> Array:
@@ -330,6 +906,7 @@ class PERT:
             the range, second element is the high end of the range.
         """
         
-        alpha = norm_dist.cdf(z) - norm_dist.cdf(-z)
+        # Phi(z) - Phi(-z) == erf(z / sqrt(2)), without cancellation for small z
+        alpha = erf(np.asarray(z) / math.sqrt(2))
         ci = self.interval(alpha)
         return ci
\ No newline at end of file
@@ -15,13 +15,17 @@ setuptools.setup(
     packages=setuptools.find_packages(),
     install_requires=[
         'numpy >=1.17, <2',
-        'scipy >=1.3, <2',
+        'scipy >=1.11, <2',
     ],
+    extras_require={
+        'numba': ['numba >=0.53'],
+        'cupy': ['cupy >=13'],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: GNU General Public License (GPL)",
         "Operating System :: OS Independent",
         "Development Status :: 2 - Pre-Alpha",
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.9',
 )
\ No newline at end of file
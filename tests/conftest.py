@@ -0,0 +1,10 @@
+""" Shared helpers for the PERT tests """
+
+from scipy import stats
+
+def reference(min_val, ml_val, max_val, lamb):
+    """ Frozen scipy Beta distribution matching a PERT """
+
+    alpha = 1 + lamb * (ml_val - min_val) / (max_val - min_val)
+    beta = 1 + lamb * (max_val - ml_val) / (max_val - min_val)
+    return stats.beta(alpha, beta, loc=min_val, scale=max_val - min_val)
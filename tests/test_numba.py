@@ -0,0 +1,127 @@
+""" Checks the optional Numba kernels against scipy over a grid of PERT shapes
+
+Covers both the public `pert.numba` functions and the dispatch from `PERT`
+methods to the kernels for large array inputs.
+"""
+
+import numpy as np
+import pytest
+from scipy import special
+
+pytest.importorskip('numba')
+
+from conftest import reference
+import pert.numba as pert_numba
+from pert import PERT
+from pert._numba import NUMBA_BETAINC_MAX_SHAPE, NUMBA_MIN_SIZE, _betaincinv, _log_betainc
+
+LAMBS = [0.1, 1.0, 4.0, 10.0, 50.0, 300.0, 1000.0]
+MODES = [0.0, 0.05, 0.3, 0.5, 0.9, 1.0]
+
+def shape_grid():
+    """ (min_val, ml_val, max_val, lamb) for every mode position and lamb """
+
+    return [(2.0, 2.0 + 5.0 * mode, 7.0, lamb) for lamb in LAMBS for mode in MODES]
+
+def probe_points(ref, n=NUMBA_MIN_SIZE):
+    """ PERT-scale values spread evenly in probability, plus the support edges """
+
+    a, c = ref.support()
+    return np.concatenate([[a - 1.0, a, c, c + 1.0], ref.ppf(np.linspace(1e-6, 1 - 1e-6, n))])
+
+@pytest.mark.parametrize('params', shape_grid())
+def test_pdf_and_logpdf_match_scipy(params):
+    ref = reference(*params)
+    x = probe_points(ref)
+    x_ref = np.clip(x, *ref.support())
+    np.testing.assert_allclose(pert_numba.pdf(x, *params), ref.pdf(x_ref), rtol=1e-9, atol=1e-300)
+    np.testing.assert_allclose(pert_numba.logpdf(x, *params), ref.logpdf(x_ref), rtol=1e-9, atol=1e-12)
+
+@pytest.mark.parametrize('params', shape_grid())
+def test_cdf_matches_scipy(params):
+    ref = reference(*params)
+    x = probe_points(ref)
+    # absolute error of the continued fraction scales with alpha + beta
+    atol = 1e-15 * (params[3] + 2)
+    np.testing.assert_allclose(pert_numba.cdf(x, *params), ref.cdf(x), rtol=0, atol=max(atol, 1e-14))
+
+@pytest.mark.parametrize('method', ['pdf', 'logpdf', 'cdf'])
+@pytest.mark.parametrize('lamb', [1.0, 4.0, 50.0])
+def test_jit_dispatch_matches_small_inputs(method, lamb):
+    dist = PERT(2.0, 3.0, 7.0, lamb=lamb)
+    x = probe_points(reference(2.0, 3.0, 7.0, lamb))
+    assert x.size >= NUMBA_MIN_SIZE
+    # below NUMBA_MIN_SIZE the same method runs on scipy
+    expected = np.concatenate([getattr(dist, method)(chunk) for chunk in np.array_split(x, 8)])
+    np.testing.assert_allclose(getattr(dist, method)(x), expected, rtol=1e-9, atol=1e-13)
+    np.testing.assert_allclose(
+        getattr(dist, method)(x.reshape(2, -1)), expected.reshape(2, -1), rtol=1e-9, atol=1e-13,
+    )
+
+def test_large_lamb_cdf_stays_on_scipy():
+    # the Numba continued fraction is off by ~1e-10 at this shape
+    lamb = 100 * NUMBA_BETAINC_MAX_SHAPE
+    dist = PERT(2.0, 3.0, 7.0, lamb=lamb)
+    x = probe_points(reference(2.0, 3.0, 7.0, lamb))
+    expected = special.betainc(dist.alpha, dist.beta, (x.clip(2.0, 7.0) - 2.0) / 5.0)
+    np.testing.assert_allclose(dist.cdf(x), expected, rtol=0, atol=1e-13)
+
+EDGE_PROBS = np.array([0.0, 1.0, 1e-100, 1e-20, 1 - 1e-12, 1 - 2.0**-53])
+
+@pytest.mark.filterwarnings('ignore:.*ibeta:RuntimeWarning')
+@pytest.mark.parametrize('params', shape_grid())
+def test_ppf_matches_scipy(params):
+    ref = reference(*params)
+    q = np.concatenate([EDGE_PROBS, np.linspace(0, 1, NUMBA_MIN_SIZE)])
+    np.testing.assert_allclose(pert_numba.ppf(q, *params), ref.ppf(q), rtol=1e-11)
+
+@pytest.mark.parametrize('params', shape_grid())
+def test_ppf_inverts_cdf(params):
+    # on [0, 1], so that small quantiles are not rounded away by adding min_val
+    min_val, ml_val, max_val, lamb = params
+    params = (0.0, (ml_val - min_val) / (max_val - min_val), 1.0, lamb)
+    q = np.linspace(1e-6, 1 - 1e-6, 101)
+    np.testing.assert_allclose(pert_numba.cdf(pert_numba.ppf(q, *params), *params), q, rtol=1e-10)
+
+def test_ppf_edges():
+    ppf_val = pert_numba.ppf(np.array([0.0, 1.0]), 2.0, 3.0, 7.0, 4.0)
+    np.testing.assert_array_equal(ppf_val, [2.0, 7.0])
+
+@pytest.mark.parametrize('params', shape_grid())
+def test_ppf_deep_lower_tail(params):
+    # scipy's betaincinv and betainc both break down this far out, so the
+    # result is checked against the log-CDF instead
+    min_val, ml_val, max_val, lamb = params
+    alpha = 1 + lamb * (ml_val - min_val) / (max_val - min_val)
+    beta = 1 + lamb * (max_val - ml_val) / (max_val - min_val)
+    log_beta = special.betaln(alpha, beta)
+    for p in (1e-300, 1e-200):
+        x = _betaincinv(alpha, beta, p, log_beta)
+        assert _log_betainc(alpha, beta, x, log_beta) == pytest.approx(np.log(p), rel=1e-12)
+
+@pytest.mark.parametrize('params', shape_grid())
+def test_ppf_subnormal_probability(params):
+    # scipy returns NaN for some of these, so only check the ordering
+    ppf_val = pert_numba.ppf(np.array([0.0, 5e-324, 1e-300]), *params)
+    assert np.all(np.isfinite(ppf_val))
+    assert ppf_val[0] <= ppf_val[1] <= ppf_val[2]
+
+@pytest.mark.parametrize('p', [-1e-300, -0.5, 1 + 2.0**-52, 2.0, np.inf, -np.inf, np.nan])
+def test_ppf_out_of_range_is_nan(p):
+    assert np.isnan(pert_numba.ppf(np.array([p]), 2.0, 3.0, 7.0, 4.0)[0])
+    assert np.isnan(_betaincinv(2.0, 3.0, p, special.betaln(2.0, 3.0)))
+
+@pytest.mark.parametrize('lamb', [1.0, 4.0, 50.0])
+def test_ppf_jit_dispatch_matches_small_inputs(lamb):
+    dist = PERT(2.0, 3.0, 7.0, lamb=lamb)
+    q = np.concatenate([EDGE_PROBS, [-0.5, 1.5, np.nan], np.linspace(0, 1, NUMBA_MIN_SIZE)])
+    expected = np.concatenate([dist.ppf(chunk) for chunk in np.array_split(q, 8)])
+    np.testing.assert_allclose(dist.ppf(q), expected, rtol=1e-11)
+    np.testing.assert_allclose(dist.ppf(q.reshape(-1, 1)), expected.reshape(-1, 1), rtol=1e-11)
+
+def test_large_lamb_ppf_stays_on_scipy():
+    lamb = 100 * NUMBA_BETAINC_MAX_SHAPE
+    dist = PERT(2.0, 3.0, 7.0, lamb=lamb)
+    q = np.linspace(0, 1, NUMBA_MIN_SIZE)
+    expected = special.betaincinv(dist.alpha, dist.beta, q) * 5.0 + 2.0
+    np.testing.assert_allclose(dist.ppf(q), expected, rtol=1e-15)
@@ -0,0 +1,270 @@
+""" Checks PERT against scipy.stats.beta as a reference implementation
+
+A PERT is a Beta(alpha, beta) distribution shifted to min_val and scaled by
+max_val - min_val, so every method has a direct `scipy.stats.beta` analogue.
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from conftest import reference
+from pert import PERT
+
+PARAMS = [
+    (0.0, 3.0, 10.0, 4.0),
+    (-5.0, -5.0, 1.0, 4.0),
+    (2.0, 7.5, 7.5, 4.0),
+    (1.0, 2.0, 100.0, 0.5),
+    (0.0, 0.3, 1.0, 40.0),
+]
+
+@pytest.fixture(params=PARAMS)
+def dists(request):
+    return PERT(*request.param), reference(*request.param)
+
+def support_points(dist):
+    """ Values spanning the PERT support, its edges and either side of it """
+
+    a, c = float(dist.a), float(dist.c)
+    return np.concatenate([[a - 1, a, c, c + 1], np.linspace(a, c, 51)[1:-1]])
+
+@pytest.mark.parametrize('method', ['pdf', 'logpdf', 'cdf', 'sf', 'logcdf', 'logsf'])
+def test_value_methods_match_scipy(dists, method):
+    dist, ref = dists
+    x = support_points(dist)
+    # outside the support the PERT clips, so the edge values are compared there
+    x_ref = np.clip(x, float(dist.a), float(dist.c))
+    expected = getattr(ref, method)(x_ref)
+    np.testing.assert_allclose(getattr(dist, method)(x), expected, rtol=1e-10, atol=1e-12)
+
+@pytest.mark.parametrize('method', ['cdf', 'sf'])
+def test_cdf_is_not_scaled_by_range(dists, method):
+    dist, ref = dists
+    x = support_points(dist)[4:]
+    np.testing.assert_allclose(getattr(dist, method)(x), getattr(ref, method)(x), rtol=1e-10, atol=1e-14)
+
+@pytest.mark.parametrize('method', ['ppf', 'isf'])
+def test_quantile_methods_match_scipy(dists, method):
+    dist, ref = dists
+    q = np.array([0.0, 1e-12, 0.01, 0.25, 0.5, 0.75, 0.99, 1 - 1e-12, 1.0])
+    np.testing.assert_allclose(getattr(dist, method)(q), getattr(ref, method)(q), rtol=1e-10)
+
+@pytest.mark.parametrize('method', ['pdf', 'logpdf', 'cdf', 'sf', 'logcdf', 'logsf', 'ppf', 'isf'])
+def test_scalar_inputs_match_array_inputs(dists, method):
+    dist, _ = dists
+    vals = (0.0, 0.3, 1.0) if method in ('ppf', 'isf') else (float(dist.a), 0.3, float(dist.c))
+    for val in vals:
+        expected = getattr(dist, method)(np.array([val]))[0]
+        assert getattr(dist, method)(val) == pytest.approx(expected, rel=1e-12, abs=1e-300)
+
+@pytest.mark.parametrize('method', ['pdf', 'logpdf', 'cdf', 'sf', 'logcdf', 'logsf', 'ppf', 'isf'])
+def test_nan_inputs_give_nan(method):
+    dist = PERT(0, 3, 10)
+    assert np.isnan(getattr(dist, method)(float('nan')))
+    assert np.isnan(getattr(dist, method)(np.array(np.nan)))
+    assert np.isnan(getattr(dist, method)(np.array([np.nan, 0.5]))[0])
+
+def test_stats_match_scipy(dists):
+    dist, ref = dists
+    mean, var = ref.stats(moments='mv')
+    stats_map = dist.stats()
+    np.testing.assert_allclose(stats_map['mean'], mean, rtol=1e-12)
+    np.testing.assert_allclose(stats_map['var'], var, rtol=1e-12)
+    np.testing.assert_allclose(dist.median(), ref.median(), rtol=1e-10)
+    np.testing.assert_allclose(dist.interval(0.9), ref.interval(0.9), rtol=1e-10)
+
+def test_vectorized_parameters_match_scipy():
+    min_val = np.array([0.0, 1.0, -2.0])
+    ml_val = np.array([3.0, 1.5, 0.0])
+    max_val = np.array([10.0, 2.0, 5.0])
+    lamb = np.array([4.0, 2.0, 8.0])
+    dist = PERT(min_val, ml_val, max_val, lamb=lamb)
+    ref = reference(min_val, ml_val, max_val, lamb)
+    x = np.array([[0.5], [1.2], [1.9]])
+    np.testing.assert_allclose(dist.pdf(x), ref.pdf(x), rtol=1e-10)
+    np.testing.assert_allclose(dist.cdf(x), ref.cdf(x), rtol=1e-10)
+    np.testing.assert_allclose(dist.ppf([[0.25], [0.75]]), ref.ppf([[0.25], [0.75]]), rtol=1e-10)
+
+def test_array_lamb_broadcasts_against_scalar_parameters():
+    lamb = np.array([2.0, 4.0])
+    dist = PERT(0, 3, 10, lamb=lamb)
+    ref = reference(0.0, 3.0, 10.0, lamb)
+    for method in ('pdf', 'logpdf', 'cdf', 'sf', 'logcdf', 'logsf'):
+        np.testing.assert_allclose(getattr(dist, method)(1.0), getattr(ref, method)(1.0), rtol=1e-10)
+
+def test_rvs_stay_within_bounds():
+    dist = PERT(2, 5, 9)
+    samples = dist.rvs(size=10000, random_state=0)
+    assert samples.shape == (10000,)
+    assert samples.min() >= 2 and samples.max() <= 9
+    assert stats.kstest(samples, reference(2.0, 5.0, 9.0, 4.0).cdf).pvalue > 1e-3
+
+@pytest.mark.parametrize('args', [(3, 2, 5), (1, 4, 3), (2, 2, 2), (0, np.nan, 1)])
+def test_invalid_parameters_raise(args):
+    with pytest.raises(ValueError):
+        PERT(*args)
+
+@pytest.mark.parametrize('kwargs', [
+    {'lamb': 0}, {'lamb': np.inf}, {'dtype': np.int64}, {'dtype': np.float16},
+    {'dtype': np.longdouble},
+])
+def test_invalid_options_raise(kwargs):
+    with pytest.raises(ValueError):
+        PERT(0, 3, 10, **kwargs)
+
+@pytest.mark.parametrize('params', [(0.0, 3.0, 10.0), ([0.0, 1.0], [3.0, 2.0], [10.0, 5.0])])
+@pytest.mark.parametrize('n', [7, 3000])
+def test_float32_outputs_keep_dtype(params, n):
+    # n = 3000 takes the Numba kernels where they are available
+    dist = PERT(*params, dtype=np.float32)
+    x = np.linspace(-1.0, 11.0, n).reshape(-1, 1)
+    q = np.linspace(0.0, 1.0, n).reshape(-1, 1)
+    outputs = {method: getattr(dist, method)(x) for method in (
+        'pdf', 'pdf_batch', 'logpdf', 'cdf', 'sf', 'logcdf', 'logsf',
+    )}
+    outputs.update({method: getattr(dist, method)(q) for method in ('ppf', 'isf')})
+    outputs.update(
+        median=dist.median(), interval=dist.interval(0.9), ci=dist.ci(1.0),
+        rvs=dist.rvs(size=n, random_state=0),
+        rvs_generator=dist.rvs(size=n, random_state=np.random.default_rng(0)),
+        rvs_none=dist.rvs(size=None, random_state=0) if np.ndim(params[0]) else np.float32(0),
+        qmc_rvs=dist.qmc_rvs(8, seed=0), range=dist.range, alpha=dist.alpha, beta=dist.beta,
+        **dist.stats(),
+    )
+    for name, value in outputs.items():
+        assert np.asarray(value).dtype == np.float32, name
+
+def test_rvs_seed_cache_returns_fresh_copies():
+    dist = PERT(2, 5, 9)
+    first = dist.rvs(size=100, random_state=7)
+    snapshot = first.copy()
+    first[:] = -1.0
+    second = dist.rvs(size=100, random_state=7)
+    assert second is not first
+    np.testing.assert_array_equal(second, snapshot)
+    second[:] = -2.0
+    np.testing.assert_array_equal(dist.rvs(size=100, random_state=7), snapshot)
+
+def test_rvs_seed_cache_is_keyed_on_seed_and_size():
+    dist = PERT(2, 5, 9)
+    base = dist.rvs(size=100, random_state=7)
+    assert not np.array_equal(dist.rvs(size=100, random_state=8), base)
+    larger = dist.rvs(size=200, random_state=7)
+    assert larger.shape == (200,)
+    np.testing.assert_array_equal(larger, np.random.default_rng(7).beta(
+        dist.alpha, dist.beta, size=200,
+    ) * 7.0 + 2.0)
+    assert dist.rvs(size=(10, 10), random_state=7).shape == (10, 10)
+
+def test_rvs_seed_cache_evicts_oldest_entries():
+    from pert.pert import _RVS_CACHE_ENTRIES
+
+    dist = PERT(2, 5, 9)
+    for seed in range(_RVS_CACHE_ENTRIES + 1):
+        dist.rvs(size=10, random_state=seed)
+    assert len(dist._rvs_cache) == _RVS_CACHE_ENTRIES
+    assert (0, (10,)) not in dist._rvs_cache
+    assert (_RVS_CACHE_ENTRIES, (10,)) in dist._rvs_cache
+    # an evicted seed is redrawn, with the same values
+    expected = np.random.default_rng(0).beta(dist.alpha, dist.beta, size=10) * 7.0 + 2.0
+    np.testing.assert_array_equal(dist.rvs(size=10, random_state=0), expected)
+
+@pytest.mark.parametrize('make_rng', [np.random.default_rng, np.random.RandomState])
+def test_rvs_random_state_objects_are_not_cached(make_rng):
+    dist = PERT(2, 5, 9)
+    rng = make_rng(7)
+    first = dist.rvs(size=100, random_state=rng)
+    second = dist.rvs(size=100, random_state=rng)
+    assert not np.array_equal(first, second)
+    assert dist._rvs_cache == {}
+
+def test_rvs_seed_cache_is_reset_by_build():
+    dist = PERT(2, 5, 9)
+    dist.rvs(size=100, random_state=7)
+    dist.c[...] = 20.0
+    dist.build()
+    expected = np.random.default_rng(7).beta(dist.alpha, dist.beta, size=100) * 18.0 + 2.0
+    np.testing.assert_array_equal(dist.rvs(size=100, random_state=7), expected)
+
+def test_ppf_grid_cache_is_keyed_on_the_pert_shape():
+    grid = [0.25, 0.75]
+    narrow, wide = PERT(0, 3, 10), PERT(0, 3, 10, lamb=1.0)
+    np.testing.assert_allclose(narrow.ppf(grid), reference(0.0, 3.0, 10.0, 4.0).ppf(grid), rtol=1e-12)
+    np.testing.assert_allclose(wide.ppf(grid), reference(0.0, 3.0, 10.0, 1.0).ppf(grid), rtol=1e-12)
+    assert not np.allclose(narrow.ppf(grid), wide.ppf(grid))
+    # same shape, different support: the unit quantiles are shared, the rescale is not
+    np.testing.assert_allclose(PERT(10, 13, 20).ppf(grid), narrow.ppf(grid) + 10, rtol=1e-12)
+
+def test_ppf_grid_cache_keeps_the_input_shape():
+    dist = PERT(0, 3, 10)
+    grid = np.linspace(0.1, 0.9, 6)
+    flat = dist.ppf(grid)
+    for shape in [(2, 3), (3, 2), (6, 1)]:
+        reshaped = dist.ppf(grid.reshape(shape))
+        assert reshaped.shape == shape
+        np.testing.assert_array_equal(reshaped, flat.reshape(shape))
+
+def test_ppf_grid_cache_results_can_be_mutated():
+    dist = PERT(0, 3, 10)
+    grid = np.array([0.25, 0.5, 0.75])
+    first = dist.ppf(grid)
+    expected = first.copy()
+    first[:] = -1.0
+    np.testing.assert_array_equal(dist.ppf(grid), expected)
+
+def test_ppf_non_float64_grid_bypasses_the_cache():
+    from pert.pert import _ppf_unit_cached
+
+    dist = PERT(0, 3, 10)
+    grid = np.array([0, 1])
+    before = _ppf_unit_cached.cache_info()
+    np.testing.assert_array_equal(dist.ppf(grid), [0.0, 10.0])
+    np.testing.assert_allclose(
+        dist.ppf(grid.astype(np.float32) / 2), reference(0.0, 3.0, 10.0, 4.0).ppf([0.0, 0.5]), rtol=1e-6,
+    )
+    after = _ppf_unit_cached.cache_info()
+    assert (after.hits, after.misses) == (before.hits, before.misses)
+
+@pytest.mark.parametrize('params', [(0.0, 3.0, 10.0), ([0.0, 1.0], [3.0, 2.0], [10.0, 5.0])])
+def test_pdf_batch_writes_into_out(params):
+    dist = PERT(*params)
+    x = np.linspace(-1.0, 11.0, 40).reshape(-1, 1)
+    buf = np.empty(np.broadcast(x, dist.alpha).shape)
+    result = dist.pdf_batch(x, out=buf)
+    assert result is buf
+    np.testing.assert_allclose(buf, dist.pdf(x), rtol=1e-14)
+    np.testing.assert_allclose(dist.pdf_batch(x), dist.pdf(x), rtol=1e-14)
+
+def test_pdf_batch_out_can_alias_the_input():
+    dist = PERT(0, 3, 10)
+    x = np.linspace(-1.0, 11.0, 40)
+    expected = dist.pdf(x)
+    result = dist.pdf_batch(x, out=x)
+    assert result is x
+    np.testing.assert_allclose(x, expected, rtol=1e-14)
+
+def test_qmc_rvs_shape_and_bounds():
+    min_val = np.array([[0.0, 1.0, -2.0]])
+    ml_val = np.array([[3.0], [1.5]])
+    max_val = 10.0
+    dist = PERT(min_val, ml_val, max_val)
+    samples = dist.qmc_rvs(64, seed=0)
+    assert samples.shape == (64, 2, 3)
+    assert np.all(samples >= dist.a) and np.all(samples <= dist.c)
+    assert PERT(0, 3, 10).qmc_rvs(16, seed=0).shape == (16,)
+
+def test_qmc_rvs_seed_is_reproducible():
+    dist = PERT(2, 5, 9)
+    np.testing.assert_array_equal(dist.qmc_rvs(128, seed=3), dist.qmc_rvs(128, seed=3))
+    assert not np.array_equal(dist.qmc_rvs(128, seed=3), dist.qmc_rvs(128, seed=4))
+    # an unscrambled Sobol sequence is deterministic without a seed
+    np.testing.assert_array_equal(dist.qmc_rvs(8, scramble=False), dist.qmc_rvs(8, scramble=False))
+
+def test_qmc_rvs_matches_scipy():
+    dist = PERT(2, 5, 9)
+    ref = reference(2.0, 5.0, 9.0, 4.0)
+    samples = dist.qmc_rvs(1024, seed=0)
+    assert stats.kstest(samples, ref.cdf).pvalue > 0.5
+    # low-discrepancy points pin the mean far tighter than Monte Carlo noise
+    assert samples.mean() == pytest.approx(ref.mean(), abs=1e-3)